@@ -56,42 +56,13 @@ Main Components:
 For detailed documentation and examples, visit: https://github.com/ladparth/fabricflow
 """
 
+import importlib
 import logging
+import os
 from logging import Logger
+from typing import Any
 from .log_utils import setup_logging
 
-# Pipeline core
-from .pipeline.executor import DataPipelineExecutor, DataPipelineError, PipelineStatus
-from .pipeline.activities import Copy, Lookup
-from .pipeline.templates import DataPipelineTemplates, get_template, get_base64_str
-from .pipeline.utils import create_data_pipeline
-
-# Pipeline sources and sinks
-from .pipeline.sinks import LakehouseTableSink, ParquetFileSink, BaseSink, SinkType
-from .pipeline.sources import (
-    BaseSource,
-    SQLServerSource,
-    SourceType,
-    GoogleBigQuerySource,
-)
-
-# Core items and workspaces
-from .core.items.manager import FabricCoreItemsManager
-from .core.items.types import FabricItemType
-from .core.workspaces.utils import get_workspace_id
-from .core.workspaces.manager import FabricWorkspacesManager
-from .core.utils import create_workspace
-
-# Connections and capacities
-from .core.connections import resolve_connection_id
-from .core.capacities import resolve_capacity_id
-
-# Authentication
-from .auth.provider import ServicePrincipalTokenProvider
-
-# Backward compatibility for CopyManager
-CopyManager = Copy
-
 __all__: list[str] = [
     # Pipeline core
     "DataPipelineExecutor",
@@ -127,6 +98,75 @@ __all__: list[str] = [
     "ServicePrincipalTokenProvider",
 ]
 
+# Public names resolved on first access (PEP 562), mapped to the submodule and
+# attribute that provide them. Importing fabricflow therefore does not pull in
+# Sempy, Azure Identity or the pipeline modules until they are actually used.
+# Keep in sync with __all__ and __init__.pyi, which exposes the same names to
+# type checkers; tests/test_exports.py checks that the three agree.
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    # Pipeline core
+    "DataPipelineExecutor": (".pipeline.executor", "DataPipelineExecutor"),
+    "DataPipelineError": (".pipeline.executor", "DataPipelineError"),
+    "PipelineStatus": (".pipeline.executor", "PipelineStatus"),
+    "DataPipelineTemplates": (".pipeline.templates", "DataPipelineTemplates"),
+    "get_template": (".pipeline.templates", "get_template"),
+    "get_base64_str": (".pipeline.templates", "get_base64_str"),
+    "create_data_pipeline": (".pipeline.utils", "create_data_pipeline"),
+    "CopyManager": (".pipeline.activities", "Copy"),
+    "Copy": (".pipeline.activities", "Copy"),
+    "Lookup": (".pipeline.activities", "Lookup"),
+    # Pipeline sources and sinks
+    "LakehouseTableSink": (".pipeline.sinks", "LakehouseTableSink"),
+    "ParquetFileSink": (".pipeline.sinks", "ParquetFileSink"),
+    "SinkType": (".pipeline.sinks", "SinkType"),
+    "BaseSink": (".pipeline.sinks", "BaseSink"),
+    "BaseSource": (".pipeline.sources", "BaseSource"),
+    "SQLServerSource": (".pipeline.sources", "SQLServerSource"),
+    "SourceType": (".pipeline.sources", "SourceType"),
+    "GoogleBigQuerySource": (".pipeline.sources", "GoogleBigQuerySource"),
+    # Core items and workspaces
+    "FabricCoreItemsManager": (".core.items.manager", "FabricCoreItemsManager"),
+    "FabricItemType": (".core.items.types", "FabricItemType"),
+    "get_workspace_id": (".core.workspaces.utils", "get_workspace_id"),
+    "FabricWorkspacesManager": (".core.workspaces.manager", "FabricWorkspacesManager"),
+    "create_workspace": (".core.utils", "create_workspace"),
+    # Connections and capacities
+    "resolve_connection_id": (".core.connections", "resolve_connection_id"),
+    "resolve_capacity_id": (".core.capacities", "resolve_capacity_id"),
+    # Authentication
+    "ServicePrincipalTokenProvider": (
+        ".auth.provider",
+        "ServicePrincipalTokenProvider",
+    ),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve a public name from its submodule on first access."""
+    try:
+        module_name, attr_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name, __name__), attr_name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
+
+
+# Set FABRICFLOW_EAGER_IMPORT=1 to resolve every export at import time, e.g. in
+# CI to surface broken imports that would otherwise only fail on first access.
+if os.environ.get("FABRICFLOW_EAGER_IMPORT") == "1":
+    for _name in _LAZY_EXPORTS:
+        __getattr__(_name)
+    del _name
+
 logger: Logger = logging.getLogger(__name__)
 
-logger.addHandler(logging.NullHandler())
+# Guard against registering a second NullHandler if the module is re-executed
+# (e.g. importlib.reload in a notebook session).
+if not any(isinstance(h, logging.NullHandler) for h in logger.handlers):
+    logger.addHandler(logging.NullHandler())
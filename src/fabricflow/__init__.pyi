@@ -0,0 +1,54 @@
+from logging import Logger
+
+from .log_utils import setup_logging as setup_logging
+
+# Pipeline core
+from .pipeline.executor import (
+    DataPipelineExecutor as DataPipelineExecutor,
+    DataPipelineError as DataPipelineError,
+    PipelineStatus as PipelineStatus,
+)
+from .pipeline.activities import Copy as Copy, Lookup as Lookup
+from .pipeline.templates import (
+    DataPipelineTemplates as DataPipelineTemplates,
+    get_template as get_template,
+    get_base64_str as get_base64_str,
+)
+from .pipeline.utils import create_data_pipeline as create_data_pipeline
+
+# Pipeline sources and sinks
+from .pipeline.sinks import (
+    LakehouseTableSink as LakehouseTableSink,
+    ParquetFileSink as ParquetFileSink,
+    BaseSink as BaseSink,
+    SinkType as SinkType,
+)
+from .pipeline.sources import (
+    BaseSource as BaseSource,
+    SQLServerSource as SQLServerSource,
+    SourceType as SourceType,
+    GoogleBigQuerySource as GoogleBigQuerySource,
+)
+
+# Core items and workspaces
+from .core.items.manager import FabricCoreItemsManager as FabricCoreItemsManager
+from .core.items.types import FabricItemType as FabricItemType
+from .core.workspaces.utils import get_workspace_id as get_workspace_id
+from .core.workspaces.manager import FabricWorkspacesManager as FabricWorkspacesManager
+from .core.utils import create_workspace as create_workspace
+
+# Connections and capacities
+from .core.connections import resolve_connection_id as resolve_connection_id
+from .core.capacities import resolve_capacity_id as resolve_capacity_id
+
+# Authentication
+from .auth.provider import (
+    ServicePrincipalTokenProvider as ServicePrincipalTokenProvider,
+)
+
+# Backward compatibility for CopyManager
+CopyManager = Copy
+
+__all__: list[str]
+
+logger: Logger
@@ -1,3 +1,30 @@
-from .provider import ServicePrincipalTokenProvider, TokenAcquisitionError
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .provider import ServicePrincipalTokenProvider, TokenAcquisitionError
 
 __all__ = ["ServicePrincipalTokenProvider", "TokenAcquisitionError"]
+
+# Resolved on first access so that importing fabricflow.auth does not load the
+# provider module (and Sempy) until a provider is actually used.
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "ServicePrincipalTokenProvider": (".provider", "ServicePrincipalTokenProvider"),
+    "TokenAcquisitionError": (".provider", "TokenAcquisitionError"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve a public name from its submodule on first access."""
+    try:
+        module_name, attr_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name, __name__), attr_name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
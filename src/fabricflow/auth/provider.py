@@ -11,15 +11,20 @@ Classes:
 
 Constants:
     PBI_SCOPE: Default Power BI API scope for token requests.
+    TOKEN_REFRESH_MARGIN: Seconds before expiry at which a cached token is refreshed.
 """
 
-from azure.identity import ClientSecretCredential
-from azure.core.credentials import AccessToken
 import logging
+import threading
+import time
 from logging import Logger
-from typing import Literal
+from typing import TYPE_CHECKING, Literal, Optional
 from sempy.fabric._token_provider import TokenProvider
 
+if TYPE_CHECKING:
+    from azure.core.credentials import AccessToken
+    from azure.identity import ClientSecretCredential
+
 logger: Logger = logging.getLogger(__name__)
 
 
@@ -34,6 +39,8 @@ class TokenAcquisitionError(Exception):
 
 PBI_SCOPE = "https://analysis.windows.net/powerbi/api/.default"
 
+TOKEN_REFRESH_MARGIN = 300
+
 
 class ServicePrincipalTokenProvider(TokenProvider):
     """Token provider for Service Principal authentication with Microsoft Fabric REST API.
@@ -43,7 +50,9 @@ class ServicePrincipalTokenProvider(TokenProvider):
     interface and supports multiple audiences (Power BI, Storage, SQL).
 
     The provider uses Azure's ClientSecretCredential to authenticate and obtain
-    access tokens for the specified scopes.
+    access tokens for the specified scopes. The credential is created on the
+    first token request rather than in the constructor, and tokens are cached
+    per audience until they are within TOKEN_REFRESH_MARGIN seconds of expiry.
 
     Attributes:
         tenant_id (str): Azure Active Directory tenant ID.
@@ -92,24 +101,36 @@ class ServicePrincipalTokenProvider(TokenProvider):
                 "Provide tenant_id, client_id, and client_secret as parameters."
             )
 
-        logger.debug(
-            "Initializing ClientSecretCredential for tenant_id=%s, client_id=%s",
-            self.tenant_id,
-            self.client_id,
-        )
-        self._credential = ClientSecretCredential(
-            tenant_id=self.tenant_id,
-            client_id=self.client_id,
-            client_secret=self.client_secret,
-        )
+        self._credential: Optional["ClientSecretCredential"] = None
+        self._token_cache: dict[str, "AccessToken"] = {}
+        self._token_lock = threading.Lock()
         logger.info("ServicePrincipalTokenProvider initialized.")
 
+    @property
+    def _cred(self) -> "ClientSecretCredential":
+        """ClientSecretCredential for the configured Service Principal, created on first use."""
+        if self._credential is None:
+            from azure.identity import ClientSecretCredential
+
+            logger.debug(
+                "Initializing ClientSecretCredential for tenant_id=%s, client_id=%s",
+                self.tenant_id,
+                self.client_id,
+            )
+            self._credential = ClientSecretCredential(
+                tenant_id=self.tenant_id,
+                client_id=self.client_id,
+                client_secret=self.client_secret,
+            )
+        return self._credential
+
     # Class-level constant for audience-to-scope mapping
     SCOPE_MAPPING = {
         "pbi": PBI_SCOPE,
         "storage": "https://storage.azure.com/.default",
         "sql": "https://database.windows.net/.default",
     }
+    _SUPPORTED_AUDIENCES = ", ".join(SCOPE_MAPPING)
 
     def __call__(self, audience: Literal["pbi", "storage", "sql"] = "pbi") -> str:
         """Get an access token for the specified audience.
@@ -126,18 +147,31 @@ class ServicePrincipalTokenProvider(TokenProvider):
         Returns:
             str: The access token.
         """
-        if audience not in self.SCOPE_MAPPING:
+        scope = self.SCOPE_MAPPING.get(audience)
+        if scope is None:
             logger.error("Unsupported audience: %s", audience)
             raise ValueError(
-                f"Unsupported audience: {audience}. Must be one of: {list(self.SCOPE_MAPPING.keys())}"
+                f"Unsupported audience: {audience}. Must be one of: {self._SUPPORTED_AUDIENCES}"
             )
 
-        scope = self.SCOPE_MAPPING[audience]
+        cached = self._token_cache.get(audience)
+        if cached is not None and cached.expires_on - time.time() > TOKEN_REFRESH_MARGIN:
+            return cached.token
 
         try:
-            logger.debug("Requesting token for audience: %s", audience)
-            token: AccessToken = self._credential.get_token(scope)
-            return token.token
+            with self._token_lock:
+                # Another thread may have refreshed the token while we waited.
+                cached = self._token_cache.get(audience)
+                if (
+                    cached is not None
+                    and cached.expires_on - time.time() > TOKEN_REFRESH_MARGIN
+                ):
+                    return cached.token
+
+                logger.debug("Requesting token for audience: %s", audience)
+                token: "AccessToken" = self._cred.get_token(scope)
+                self._token_cache[audience] = token
+                return token.token
         except Exception as e:
             logger.exception(
                 "Failed to acquire token for audience '%s': %s", audience, str(e)
@@ -146,7 +180,7 @@ class ServicePrincipalTokenProvider(TokenProvider):
                 f"Failed to acquire token for audience '{audience}': {str(e)}"
             ) from e
 
-    def get_access_token(self, scope: str = PBI_SCOPE) -> AccessToken:
+    def get_access_token(self, scope: str = PBI_SCOPE) -> "AccessToken":
         """Get the full AccessToken object for the specified scope.
 
         Args:
@@ -165,7 +199,7 @@ class ServicePrincipalTokenProvider(TokenProvider):
 
         try:
             logger.debug("Requesting AccessToken object for scope: %s", scope)
-            return self._credential.get_token(scope)
+            return self._cred.get_token(scope)
         except Exception as e:
             logger.exception(
                 "Failed to acquire access token for scope '%s': %s", scope, str(e)
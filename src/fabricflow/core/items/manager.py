@@ -28,6 +28,7 @@ Key Features:
     - Automatic workspace resolution (name or ID)
     - Type-safe item creation with FabricItemType enum
     - Paginated listing support for large item collections
+    - Concurrent bulk creation and deletion of items
     - Comprehensive error handling and validation
     - Support for item definitions and metadata
 
@@ -85,7 +86,8 @@ Dependencies:
     - fabricflow.core.items.types: For FabricItemType definitions
 """
 
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List
 from sempy.fabric import FabricRestClient
 from ..workspaces.utils import get_workspace_id
 from .types import FabricItemType
@@ -110,12 +112,13 @@ class FabricCoreItemsManager:
             client (FabricRestClient): An authenticated FabricRestClient instance.
             workspace (Optional[str]): The Fabric workspace name or ID. If None, the default workspace will be used.
         """
-        self.client = client
-        self.workspace_id = get_workspace_id(workspace)
-        if not isinstance(self.client, FabricRestClient):
+        if not isinstance(client, FabricRestClient):
             raise TypeError(
                 "Client must be an instance of FabricRestClient from sempy.fabric"
             )
+        self.client = client
+        self.workspace_id = get_workspace_id(workspace)
+        self._items_url: str = f"/v1/workspaces/{self.workspace_id}/items"
 
     def create_item(
         self,
@@ -137,7 +140,7 @@ class FabricCoreItemsManager:
         payload: Dict[str, Any] = {"displayName": display_name, "type": item_type.value}
         if definition is not None:
             payload["definition"] = definition
-        url: str = f"/v1/workspaces/{self.workspace_id}/items"
+        url: str = self._items_url
         response = self.client.post(url, json=payload)
         response.raise_for_status()
         return response.json()
@@ -152,7 +155,7 @@ class FabricCoreItemsManager:
         Returns:
             Dict[str, Any]: The item details as a dictionary.
         """
-        url: str = f"/v1/workspaces/{self.workspace_id}/items/{item_id}"
+        url: str = f"{self._items_url}/{item_id}"
         response = self.client.get(url)
         response.raise_for_status()
         return response.json()
@@ -168,7 +171,7 @@ class FabricCoreItemsManager:
         Returns:
             Dict[str, Any]: The updated item details as a dictionary.
         """
-        url: str = f"/v1/workspaces/{self.workspace_id}/items/{item_id}"
+        url: str = f"{self._items_url}/{item_id}"
         response = self.client.patch(url, json=updates)
         response.raise_for_status()
         return response.json()
@@ -180,10 +183,54 @@ class FabricCoreItemsManager:
         Args:
             item_id (str): The ID of the item to delete.
         """
-        url: str = f"/v1/workspaces/{self.workspace_id}/items/{item_id}"
+        url: str = f"{self._items_url}/{item_id}"
         response = self.client.delete(url)
         response.raise_for_status()
 
+    def bulk_create_items(
+        self, items: List[Dict[str, Any]], max_workers: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Create multiple items in the Fabric workspace concurrently.
+
+        Each entry is passed to create_item() as keyword arguments, and the calls
+        are dispatched from a thread pool sharing this manager's client. Throttled
+        requests (HTTP 429) are retried by the client's retry policy.
+
+        Args:
+            items (List[Dict[str, Any]]): Item specifications, each with a
+                display_name, an item_type and an optional definition.
+            max_workers (int): Maximum number of concurrent requests. Defaults to 8.
+
+        Returns:
+            List[Dict[str, Any]]: The created item details, in the same order as items.
+
+        Raises:
+            HTTPError: If any item creation fails. Items that were already
+                created are not rolled back.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda item: self.create_item(**item), items))
+
+    def bulk_delete_items(self, item_ids: List[str], max_workers: int = 8) -> None:
+        """
+        Delete multiple items from the Fabric workspace concurrently.
+
+        Args:
+            item_ids (List[str]): The IDs of the items to delete.
+            max_workers (int): Maximum number of concurrent requests. Defaults to 8.
+
+        Raises:
+            HTTPError: If any item deletion fails. The other deletions still run,
+                and the first failure in input order is raised.
+        """
+        # Submit every deletion up front: Executor.map would cancel the pending
+        # ones as soon as an earlier deletion failed.
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self.delete_item, i) for i in item_ids]
+        for future in futures:
+            future.result()
+
     def list_items(
         self, params: Optional[Dict[str, Any]] = None, paged: bool = False
     ) -> list | Dict[str, Any]:
@@ -197,7 +244,7 @@ class FabricCoreItemsManager:
         Returns:
             list or Dict[str, Any]: The list of items (paged or single response).
         """
-        url: str = f"/v1/workspaces/{self.workspace_id}/items"
+        url: str = self._items_url
         if paged:
             return self.client.get_paged(url, params=params)
         response = self.client.get(url, params=params)
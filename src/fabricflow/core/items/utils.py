@@ -10,6 +10,7 @@ and other workspace artifacts that can be managed through the REST API.
 Functions:
     resolve_item: Resolve an item name or validate an ID to get the item ID.
     is_valid_item_id: Check if an item ID or name is valid in a workspace.
+    clear_item_id_cache: Drop cached item resolutions.
 
 Example:
     ```python
@@ -25,11 +26,46 @@ Example:
     ```
 """
 
+import threading
+from concurrent.futures import Future
+from functools import lru_cache
 from uuid import UUID
-from typing import Any
+from typing import Any, Callable, Hashable, TypeVar
 from .types import FabricItemType
+from ..workspaces.utils import get_workspace_id
 from sempy.fabric import resolve_item_id, resolve_item_name
 
+_T = TypeVar("_T")
+
+# Resolutions currently in progress, so that concurrent callers asking for the
+# same item wait for one Sempy call instead of each issuing their own.
+_in_flight: dict[Hashable, Future] = {}
+_in_flight_lock = threading.Lock()
+
+
+def _single_flight(key: Hashable, func: Callable[..., _T], *args: Any) -> _T:
+    with _in_flight_lock:
+        future = _in_flight.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = Future()
+            _in_flight[key] = future
+
+    if not is_owner:
+        return future.result()
+
+    try:
+        result = func(*args)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _in_flight_lock:
+            del _in_flight[key]
+
 
 def resolve_item(
     item: str,
@@ -84,8 +120,39 @@ def resolve_item(
     Note:
         This function uses Sempy's fabric module for item resolution.
         Ensure you have appropriate permissions to access the item and workspace.
+        Successful resolutions are cached for the lifetime of the process; call
+        clear_item_id_cache() after renaming, deleting or recreating items.
     """
 
+    # Resolve the current workspace first so that the cache key does not pin
+    # the workspace context that was active on the first call.
+    return _resolve_item(
+        str(item),
+        item_type,
+        get_workspace_id() if workspace is None else str(workspace),
+    )
+
+
+@lru_cache(maxsize=512)
+def _resolve_item(
+    item: str,
+    item_type: FabricItemType | None,
+    workspace: str,
+) -> str | Any:
+    return _single_flight(
+        ("resolve_item", item, item_type, workspace),
+        _lookup_item,
+        item,
+        item_type,
+        workspace,
+    )
+
+
+def _lookup_item(
+    item: str,
+    item_type: FabricItemType | None,
+    workspace: str,
+) -> str | Any:
     _item_type: str | None = item_type.value if item_type else None
 
     try:
@@ -146,10 +213,44 @@ def is_valid_item_id(
     Note:
         This function catches all exceptions and returns False for any errors,
         including permission issues, network problems, or item not found.
+        Items found to be valid are cached until clear_item_id_cache() is called;
+        failed checks are not cached and are retried on the next call.
     """
     try:
-        _item_type: str | None = item_type.value if item_type else None
-        resolved_name = resolve_item_name(item, _item_type, workspace)
+        resolved_name = _resolve_item_name(
+            str(item),
+            item_type,
+            get_workspace_id() if workspace is None else str(workspace),
+        )
         return isinstance(resolved_name, str)
     except Exception:
         return False
+
+
+@lru_cache(maxsize=512)
+def _resolve_item_name(
+    item: str,
+    item_type: FabricItemType | None,
+    workspace: str,
+) -> str | Any:
+    _item_type: str | None = item_type.value if item_type else None
+    return _single_flight(
+        ("resolve_item_name", item, item_type, workspace),
+        resolve_item_name,
+        item,
+        _item_type,
+        workspace,
+    )
+
+
+def clear_item_id_cache() -> None:
+    """
+    Clear the cache of resolved item IDs.
+
+    resolve_item() caches its results because item IDs do not change. Call this
+    function if an item has been renamed, or deleted and recreated under the
+    same name, during the lifetime of the process. This also clears the cache
+    used by is_valid_item_id().
+    """
+    _resolve_item.cache_clear()
+    _resolve_item_name.cache_clear()
@@ -84,11 +84,11 @@ class FabricWorkspacesManager:
         Args:
             client (FabricRestClient): An authenticated FabricRestClient instance.
         """
-        self.client = client
-        if not isinstance(self.client, FabricRestClient):
+        if not isinstance(client, FabricRestClient):
             raise TypeError(
                 "client must be an instance of FabricRestClient from sempy.fabric"
             )
+        self.client = client
 
     def __str__(self) -> str:
         return f"FabricWorkspacesManager(client={self.client})"
@@ -7,6 +7,7 @@ to IDs and handling default workspace scenarios.
 
 Functions:
     get_workspace_id: Resolve workspace name to ID or return default workspace ID.
+    clear_workspace_id_cache: Drop cached workspace name-to-ID resolutions.
 
 Example:
     ```python
@@ -23,6 +24,7 @@ Example:
     ```
 """
 
+from functools import lru_cache
 from typing import Optional
 import sempy.fabric as fabric
 
@@ -66,9 +68,27 @@ def get_workspace_id(workspace: Optional[str] = None) -> str:
     Note:
         This function uses Sempy's fabric module for workspace resolution.
         Ensure you have appropriate permissions to access the workspace.
+        Resolved IDs are cached for the lifetime of the process; call
+        clear_workspace_id_cache() after renaming or recreating a workspace.
     """
 
     if workspace is None:
         return fabric.get_workspace_id()
 
+    return _resolve_workspace_id(workspace)
+
+
+@lru_cache(maxsize=128)
+def _resolve_workspace_id(workspace: str) -> str:
     return fabric.resolve_workspace_id(workspace)
+
+
+def clear_workspace_id_cache() -> None:
+    """
+    Clear the cache of resolved workspace IDs.
+
+    Workspace IDs are stable, so get_workspace_id() caches name-to-ID
+    resolutions. Call this function if a workspace has been renamed, or deleted
+    and recreated under the same name, during the lifetime of the process.
+    """
+    _resolve_workspace_id.cache_clear()
@@ -217,7 +217,10 @@ class BaseActivityExecutor(DataPipelineExecutor, ABC):
         )
 
         logger.info(
-            f"{activity_type}ActivityExecutor initialized for workspace {self.workspace_id} and pipeline {self.pipeline_id}."
+            "%sActivityExecutor initialized for workspace %s and pipeline %s.",
+            activity_type,
+            self.workspace_id,
+            self.pipeline_id,
         )
 
     @abstractmethod
@@ -234,6 +237,8 @@ class BaseActivityExecutor(DataPipelineExecutor, ABC):
         """
         Get the default filter for this activity type.
 
+        A new list is returned on every call, so callers may modify it.
+
         Returns:
             List containing the activity filter
         """
@@ -275,20 +275,26 @@ class Copy:
 
         if self._source is None or self._sink is None:
             raise ValueError("Both source and sink must be set before setting items.")
-        required_keys: list[str] = (
-            self._source.required_params + self._sink.required_params
-        )
+        required_keys: list[str] = [
+            *self._source.required_params,
+            *self._sink.required_params,
+        ]
+        required_key_set: frozenset[str] = frozenset(required_keys)
+
+        source_dict = self._source.to_dict()
+        has_query_timeout: bool = "query_timeout" in source_dict
+        query_timeout = source_dict.get("query_timeout")
+
         for item in items:
-            if not all(key in item for key in required_keys):
+            if not required_key_set.issubset(item):
                 raise ValueError(
                     f"Each item must contain the following keys: {required_keys}"
                 )
-            source_dict = self._source.to_dict()
-            if "query_timeout" in source_dict:
-                item["query_timeout"] = source_dict["query_timeout"]
 
-            if "isolation_level" not in item:
-                item["isolation_level"] = None
+            if has_query_timeout:
+                item["query_timeout"] = query_timeout
+
+            item.setdefault("isolation_level", None)
 
         self._extra_params["items"] = items
         return self
@@ -348,6 +354,13 @@ class Copy:
             "payload": self._payload,
         }
 
+    def pretty(self) -> str:
+        """
+        Returns an indented JSON string representation of the Copy object.
+        This includes the workspace, pipeline and the full execution payload.
+        """
+        return json.dumps(self.to_dict(), indent=4)
+
     def __str__(self) -> str:
         """
 
@@ -356,10 +369,14 @@ class Copy:
 
         """
 
-        return json.dumps(self.to_dict(), indent=4)
+        return self.pretty()
 
     def __repr__(self) -> str:
         """
-        Returns a string representation of the Copy object.
+        Returns a compact string representation of the Copy object.
+        Use pretty() or str() for the full payload.
         """
-        return self.__str__()
+        return (
+            f"Copy(workspace={self.workspace!r}, pipeline={self.pipeline!r}, "
+            f"items={len(self._extra_params.get('items', []))})"
+        )
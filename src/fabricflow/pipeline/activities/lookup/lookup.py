@@ -10,6 +10,7 @@ Classes:
 
 The Lookup activity supports both single and batch lookup operations, with
 parameterization support for dynamic queries and flexible source configuration.
+Several configured lookups can be run concurrently with Lookup.execute_many().
 
 Example:
     ```python
@@ -30,6 +31,7 @@ Example:
     ```
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Any
 from sempy.fabric import FabricRestClient
 
@@ -116,6 +118,7 @@ class Lookup:
         self._source: Optional[BaseSource] = None
         self._extra_params: dict = {}
         self._payload = {"executionData": {"parameters": {}}}
+        self._built: bool = False
         self.default_poll_timeout = default_poll_timeout
         self.default_poll_interval = default_poll_interval
 
@@ -149,6 +152,7 @@ class Lookup:
             ```
         """
         self._source = source
+        self._built = False
         return self
 
     def params(self, **kwargs) -> "Lookup":
@@ -176,6 +180,7 @@ class Lookup:
             ```
         """
         self._extra_params.update(kwargs)
+        self._built = False
         return self
 
     def items(self, items: list[dict]) -> "Lookup":
@@ -222,49 +227,53 @@ class Lookup:
 
         if self._source is None:
             raise ValueError("Source must be set before setting items.")
-        required_keys: list[str] = self._source.required_params.copy()
+        required_keys: list[str] = list(self._source.required_params)
+        required_key_set: frozenset[str] = frozenset(required_keys)
 
         source_dict = self._source.to_dict()
-        for item in items:
+        has_query_timeout: bool = "query_timeout" in source_dict
+        query_timeout = source_dict.get("query_timeout")
 
-            if not all(key in item for key in required_keys):
+        for item in items:
+            if not required_key_set.issubset(item):
                 raise ValueError(
                     f"Each item must contain the following keys: {required_keys}"
                 )
 
-            if "query_timeout" in source_dict:
-                item["query_timeout"] = source_dict["query_timeout"]
+            if has_query_timeout:
+                item["query_timeout"] = query_timeout
 
-            if "isolation_level" not in item:
-                item["isolation_level"] = None
-
-            if "first_row_only" not in item:
-                item["first_row_only"] = False
+            item.setdefault("isolation_level", None)
+            item.setdefault("first_row_only", False)
 
         self._extra_params["items"] = items
+        self._built = False
         return self
 
     def build(self) -> "Lookup":
         """
         Builds the lookup activity parameters.
+        Does nothing if the parameters were already built and the source, params
+        and items have not changed since.
         Returns:
             Lookup: The builder instance with payload ready for execution.
         Raises:
             ValueError: If source is not set.
         """
+        if self._built:
+            return self
+
         if self._source is None:
             raise ValueError("Source must be set before building parameters.")
 
         # Ensure 'first_row_only' is present; default to False if missing
-        source_dict = self._source.to_dict()
-        if "first_row_only" not in source_dict:
-            source_dict["first_row_only"] = False
-
         params: dict[str, Any] = {
-            **source_dict,
+            "first_row_only": False,
+            **self._source.to_dict(),
             **self._extra_params,
         }
         self._payload["executionData"]["parameters"] = params
+        self._built = True
         return self
 
     def execute(self) -> dict:
@@ -274,8 +283,7 @@ class Lookup:
             dict: Pipeline execution result (pipeline_id, status, activity_data).
         """
         # Build the payload if not already done
-        if not self._payload["executionData"]["parameters"]:
-            self.build()
+        self.build()
 
         result: dict[str, Any] = LookupActivityExecutor(
             client=self.client,
@@ -288,6 +296,43 @@ class Lookup:
 
         return result
 
+    @staticmethod
+    def execute_many(lookups: list["Lookup"], max_workers: int = 8) -> list[dict]:
+        """
+        Executes several lookup activities concurrently.
+
+        Each lookup is triggered and polled on its own worker thread, so the total
+        time is close to that of the slowest pipeline rather than the sum of all
+        of them. Lookups that share a FabricRestClient also share its connection pool.
+
+        Args:
+            lookups (list[Lookup]): Configured lookup builders to execute.
+            max_workers (int): Maximum number of pipelines run at the same time.
+                Defaults to 8.
+
+        Returns:
+            list[dict]: Pipeline execution results, in the same order as lookups.
+
+        Raises:
+            DataPipelineError: If any of the pipeline executions fails. The other
+                lookups still run to completion, and the first failure in input
+                order is raised.
+
+        Example:
+            ```python
+            lookups = [
+                Lookup(client, "MyWorkspace", LOOKUP_SQL_SERVER).source(source)
+                for source in sources
+            ]
+            results = Lookup.execute_many(lookups)
+            ```
+        """
+        # Submit every lookup up front: Executor.map would cancel the pending
+        # ones as soon as an earlier lookup failed.
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(Lookup.execute, lookup) for lookup in lookups]
+        return [future.result() for future in futures]
+
     def to_dict(self) -> dict[str, Any]:
         """
         Converts the Lookup object to a dictionary representation.
@@ -302,15 +347,26 @@ class Lookup:
             "payload": self._payload,
         }
 
+    def pretty(self) -> str:
+        """
+        Returns an indented JSON string representation of the Lookup object.
+        This includes the workspace, pipeline and the full execution payload.
+        """
+        return json.dumps(self.to_dict(), indent=4)
+
     def __str__(self) -> str:
         """
         Returns a JSON string representation of the Lookup object.
         This includes the workspace, pipeline, source, and extra parameters.
         """
-        return json.dumps(self.to_dict(), indent=4)
+        return self.pretty()
 
     def __repr__(self) -> str:
         """
-        Returns a string representation of the Lookup object.
+        Returns a compact string representation of the Lookup object.
+        Use pretty() or str() for the full payload.
         """
-        return self.__str__()
+        return (
+            f"Lookup(workspace={self.workspace!r}, pipeline={self.pipeline!r}, "
+            f"items={len(self._extra_params.get('items', []))})"
+        )
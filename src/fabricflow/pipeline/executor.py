@@ -11,22 +11,33 @@ Classes:
     DataPipelineError: Custom exception for pipeline-related errors.
 
 The module supports both synchronous and asynchronous pipeline execution
-patterns with configurable timeout and polling intervals.
+patterns with configurable timeout and polling intervals. Polling backs off
+exponentially (with jitter) up to the configured interval and honours the
+Retry-After header on throttled responses.
 """
 
 from datetime import timedelta, datetime
+import random
 import time
 import logging
 from logging import Logger
-from typing import Optional, List, Dict, Any
+from typing import TYPE_CHECKING, Optional, List, Dict, Any
 from enum import Enum
 from sempy.fabric import FabricRestClient
 from ..core.workspaces.utils import get_workspace_id
 from ..core.items.types import FabricItemType
 from ..core.items.utils import resolve_item
 
+if TYPE_CHECKING:
+    from requests import Response
+
 logger: Logger = logging.getLogger(__name__)
 
+# First polling delay in seconds; doubles on every attempt up to the poll interval.
+POLL_BACKOFF_BASE = 2
+# Largest exponent used for the backoff, so long-running loops cannot overflow.
+POLL_BACKOFF_MAX_EXPONENT = 16
+
 
 class PipelineStatus(Enum):
     """Enumeration of possible Microsoft Fabric pipeline execution statuses.
@@ -49,6 +60,21 @@ class PipelineStatus(Enum):
     PENDING = "Pending"
 
 
+# Statuses after which a pipeline run will not change any more.
+_FINAL_STATUSES: frozenset[str] = frozenset(
+    {
+        PipelineStatus.COMPLETED.value,
+        PipelineStatus.FAILED.value,
+        PipelineStatus.CANCELLED.value,
+    }
+)
+
+
+def _format_timestamp(value: datetime) -> str:
+    """Format a timestamp as expected by the queryactivityruns API."""
+    return value.replace(tzinfo=None).isoformat(timespec="microseconds") + "Z"
+
+
 class DataPipelineError(Exception):
     """Custom exception for pipeline-related errors.
     
@@ -89,7 +115,7 @@ class DataPipelineExecutor:
         pipeline_id (str): Resolved pipeline ID.
         payload (Dict[str, Any]): Execution parameters payload.
         default_poll_timeout (int): Default timeout for polling operations.
-        default_poll_interval (int): Default interval between status checks.
+        default_poll_interval (int): Maximum interval between status checks.
 
     Example:
         >>> from sempy.fabric import FabricRestClient
@@ -122,7 +148,7 @@ class DataPipelineExecutor:
             pipeline: The pipeline name or ID to execute
             payload: The JSON payload to send when triggering the pipeline
             default_poll_timeout: How long to wait for operations (seconds)
-            default_poll_interval: How often to check status (seconds)
+            default_poll_interval: Maximum time between status checks (seconds)
         """
         self.client = client
         self.workspace_id = get_workspace_id(workspace)
@@ -135,10 +161,56 @@ class DataPipelineExecutor:
         self.default_poll_timeout = default_poll_timeout
         self.default_poll_interval = default_poll_interval
 
+        # The pipeline URLs only vary by job instance ID, so build them once.
+        self._items_url: str = f"v1/workspaces/{self.workspace_id}/items/{self.pipeline_id}"
+        self._trigger_url: str = f"{self._items_url}/jobs/instances?jobType=Pipeline"
+        self._instance_url_tmpl: str = f"{self._items_url}/jobs/instances/{{jid}}"
+        self._queryruns_url_tmpl: str = (
+            f"v1/workspaces/{self.workspace_id}/datapipelines/pipelineruns/{{jid}}"
+            "/queryactivityruns"
+        )
+
         logger.info(
-            f"DataPipelineExecutor initialized for workspace {self.workspace_id} and pipeline {self.pipeline_id}."
+            "DataPipelineExecutor initialized for workspace %s and pipeline %s.",
+            self.workspace_id,
+            self.pipeline_id,
         )
 
+    def _poll_delay(
+        self,
+        attempt: int,
+        response: Optional["Response"] = None,
+        end_time: Optional[datetime] = None,
+    ) -> float:
+        """
+        Compute how long to wait before the next polling request.
+
+        Args:
+            attempt: Zero-based number of polls made so far
+            response: The last response received, if any
+            end_time: Deadline of the polling loop, if any
+
+        Returns:
+            The Retry-After value for throttled (HTTP 429) responses, otherwise an
+            exponential backoff with jitter, capped at default_poll_interval. The
+            delay never extends past end_time.
+        """
+        delay: Optional[float] = None
+        if response is not None and response.status_code == 429:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after and retry_after.isdigit():
+                delay = float(retry_after)
+
+        if delay is None:
+            # Cap first and jitter downwards, so that capped delays still vary
+            # between concurrent pollers and never exceed default_poll_interval.
+            backoff = POLL_BACKOFF_BASE * 2 ** min(attempt, POLL_BACKOFF_MAX_EXPONENT)
+            delay = min(self.default_poll_interval, backoff) * random.uniform(0.5, 1.0)
+
+        if end_time is not None:
+            delay = min(delay, max(0.0, (end_time - datetime.now()).total_seconds()))
+        return delay
+
     def trigger_pipeline(self) -> Optional[str]:
         """
         Trigger the pipeline execution.
@@ -149,13 +221,10 @@ class DataPipelineExecutor:
         Raises:
             DataPipelineError: If the API call fails or response is invalid
         """
-        logger.info(f"Triggering pipeline job for pipeline_id: {self.pipeline_id}...")
+        logger.info("Triggering pipeline job for pipeline_id: %s...", self.pipeline_id)
 
         try:
-            response = self.client.post(
-                f"v1/workspaces/{self.workspace_id}/items/{self.pipeline_id}/jobs/instances?jobType=Pipeline",
-                json=self.payload,
-            )
+            response = self.client.post(self._trigger_url, json=self.payload)
             response.raise_for_status()
 
             location = response.headers.get("Location")
@@ -167,7 +236,7 @@ class DataPipelineExecutor:
             job_instance_id: str = str(location.split("/")[-1])
 
             logger.info(
-                f"Pipeline triggered successfully. Job instance ID: {job_instance_id}"
+                "Pipeline triggered successfully. Job instance ID: %s", job_instance_id
             )
             return job_instance_id
 
@@ -181,6 +250,8 @@ class DataPipelineExecutor:
         Wait for the pipeline execution to become visible in the API.
 
         Sometimes there's a delay between triggering and the job being queryable.
+        run() no longer calls this, as poll_for_status() already keeps polling
+        while the job instance is not found; it is kept for existing callers.
 
         Args:
             job_instance_id: The job instance ID to check
@@ -189,28 +260,28 @@ class DataPipelineExecutor:
             DataPipelineError: If timeout is reached
         """
         logger.info(
-            f"Waiting for pipeline execution {job_instance_id} to be visible..."
+            "Waiting for pipeline execution %s to be visible...", job_instance_id
         )
 
-        # Give it an initial wait before starting to poll
-        time.sleep(self.default_poll_interval)
         end_time: datetime = datetime.now() + timedelta(
             seconds=self.default_poll_timeout
         )
+        instance_url: str = self._instance_url_tmpl.format(jid=job_instance_id)
+        attempt = 0
 
         while datetime.now() < end_time:
+            response: Optional["Response"] = None
             try:
-                response = self.client.get(
-                    f"v1/workspaces/{self.workspace_id}/items/{self.pipeline_id}/jobs/instances/{job_instance_id}"
-                )
+                response = self.client.get(instance_url)
                 if response.status_code == 200:
-                    logger.info(f"Pipeline execution {job_instance_id} is now visible.")
+                    logger.info("Pipeline execution %s is now visible.", job_instance_id)
                     return
 
             except Exception as e:
-                logger.warning(f"Error checking visibility: {e}")
+                logger.warning("Error checking visibility: %s", e)
 
-            time.sleep(self.default_poll_interval)
+            time.sleep(self._poll_delay(attempt, response, end_time))
+            attempt += 1
 
         # If we reach here, we timed out waiting for visibility
         error_msg = f"Timeout waiting for pipeline execution {job_instance_id} to become visible"
@@ -221,6 +292,9 @@ class DataPipelineExecutor:
         """
         Poll the pipeline execution until it reaches a final status.
 
+        A job instance that is not yet visible in the API (HTTP 404) is polled
+        again, so this can be called right after triggering the pipeline.
+
         Args:
             job_instance_id: The job instance ID to monitor
 
@@ -230,43 +304,47 @@ class DataPipelineExecutor:
         Raises:
             DataPipelineError: If polling fails or timeout is reached
         """
-        logger.info(f"Polling status for pipeline execution: {job_instance_id}...")
+        logger.info("Polling status for pipeline execution: %s...", job_instance_id)
 
         end_time: datetime = datetime.now() + timedelta(
             seconds=self.default_poll_timeout
         )
+        instance_url: str = self._instance_url_tmpl.format(jid=job_instance_id)
+        attempt = 0
 
         while datetime.now() < end_time:
+            response: Optional["Response"] = None
             try:
-                response = self.client.get(
-                    f"v1/workspaces/{self.workspace_id}/items/{self.pipeline_id}/jobs/instances/{job_instance_id}"
-                )
-                response.raise_for_status()
-
-                data = response.json()
-                status = data.get("status")
-
-                if not status:
-                    logger.warning("Status field missing from response")
-                    continue
-
-                logger.info(f"Current status: {status}")
-
-                # Check if we've reached a final status
-                final_statuses: list[str] = [
-                    PipelineStatus.COMPLETED.value,
-                    PipelineStatus.FAILED.value,
-                    PipelineStatus.CANCELLED.value,
-                ]
-
-                if status in final_statuses:
-                    logger.info(f"Pipeline execution completed with status: {status}")
-                    return status
+                response = self.client.get(instance_url)
+                if response.status_code == 404:
+                    logger.info(
+                        "Pipeline execution %s is not visible yet", job_instance_id
+                    )
+                elif response.status_code == 429:
+                    logger.warning("Throttled while polling status, backing off")
+                else:
+                    response.raise_for_status()
+
+                    data = response.json()
+                    status = data.get("status")
+
+                    if not status:
+                        logger.warning("Status field missing from response")
+                    else:
+                        logger.info("Current status: %s", status)
+
+                        # Check if we've reached a final status
+                        if status in _FINAL_STATUSES:
+                            logger.info(
+                                "Pipeline execution completed with status: %s", status
+                            )
+                            return status
 
             except Exception as e:
-                logger.error(f"Error polling status: {e}")
+                logger.error("Error polling status: %s", e)
 
-            time.sleep(self.default_poll_interval)
+            time.sleep(self._poll_delay(attempt, response, end_time))
+            attempt += 1
 
         # If we get here, we timed out waiting for status
         error_msg = f"Timeout reached while polling status for job {job_instance_id}"
@@ -298,41 +376,40 @@ class DataPipelineExecutor:
         filter_params: dict[str, Any] = {
             "filters": filters,
             "orderBy": [{"orderBy": "ActivityRunStart", "order": "DESC"}],
-            "lastUpdatedAfter": start_time.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
-            "lastUpdatedBefore": datetime.now().strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+            "lastUpdatedAfter": _format_timestamp(start_time),
+            "lastUpdatedBefore": _format_timestamp(datetime.now()),
         }
 
+        queryruns_url: str = self._queryruns_url_tmpl.format(jid=job_instance_id)
         activity_results: List[Dict[str, Any]] = []
-        poll_interval = 30
         end_time: datetime = datetime.now() + timedelta(seconds=timeout)
+        attempt = 0
 
         while not activity_results and datetime.now() < end_time:
+            response: Optional["Response"] = None
             try:
-                response = self.client.post(
-                    f"v1/workspaces/{self.workspace_id}/datapipelines/pipelineruns/{job_instance_id}/queryactivityruns",
-                    json=filter_params,
-                )
+                response = self.client.post(queryruns_url, json=filter_params)
                 response.raise_for_status()
                 activity_results = response.json()
 
                 if activity_results:
-                    logger.info(f"Found {len(activity_results)} activity run results")
+                    logger.info("Found %d activity run results", len(activity_results))
                     break
 
             except Exception as e:
-                logger.warning(f"Error querying activity runs: {e}")
+                logger.warning("Error querying activity runs: %s", e)
 
             if not activity_results:
                 logger.info("No activity runs found yet, waiting...")
-                time.sleep(poll_interval)
+                time.sleep(self._poll_delay(attempt, response, end_time))
+                attempt += 1
                 # Update the end time filter for the next query
-                filter_params["lastUpdatedBefore"] = datetime.now().strftime(
-                    "%Y-%m-%dT%H:%M:%S.%fZ"
-                )
+                filter_params["lastUpdatedBefore"] = _format_timestamp(datetime.now())
 
         if not activity_results:
             logger.warning(
-                f"No activity runs found for job {job_instance_id} within timeout period"
+                "No activity runs found for job %s within timeout period",
+                job_instance_id,
             )
 
         return activity_results
@@ -345,9 +422,8 @@ class DataPipelineExecutor:
 
         This is the main method that:
         1. Triggers the pipeline
-        2. Waits for it to be visible
-        3. Polls for completion
-        4. Queries activity runs
+        2. Polls for completion, waiting for the run to become visible
+        3. Queries activity runs
 
         Args:
             query_activity_runs_filters: Optional filters for activity run queries
@@ -363,7 +439,7 @@ class DataPipelineExecutor:
 
         start_time: datetime = datetime.now()
         logger.info(
-            f"Starting pipeline execution workflow for pipeline {self.pipeline_id}"
+            "Starting pipeline execution workflow for pipeline %s", self.pipeline_id
         )
 
         try:
@@ -375,19 +451,18 @@ class DataPipelineExecutor:
                     "Failed to trigger pipeline: job_instance_id is None"
                 )
 
-            # Step 2: Wait for visibility
-            self.wait_for_visibility(job_instance_id)
-
-            # Step 3: Poll for completion
+            # Step 2: Poll for completion (also covers the run becoming visible)
             final_status: str = self.poll_for_status(job_instance_id)
 
-            # Step 4: Get activity runs
+            # Step 3: Get activity runs
             activity_results: list[dict[str, Any]] = self.query_activity_runs(
                 job_instance_id, start_time, query_activity_runs_filters
             )
 
             logger.info(
-                f"Pipeline workflow completed. Status: {final_status}, Activities: {len(activity_results)}"
+                "Pipeline workflow completed. Status: %s, Activities: %d",
+                final_status,
+                len(activity_results),
             )
             # Return the results
             return {
@@ -90,7 +90,7 @@ class BaseSink(ABC):
         This constructor should be called by all subclass constructors using super().__init__().
         It provides any common initialization logic needed by all sinks.
         """
-        logger.debug(f"Initializing {self.__class__.__name__}")
+        logger.debug("Initializing %s", self.__class__.__name__)
 
     @property
     @abstractmethod
@@ -96,8 +96,11 @@ class LakehouseFilesSink(BaseSink):
         self.max_concurrent_connections = max_concurrent_connections
 
         logger.info(
-            f"LakehouseFilesSink initialized: sink_directory='{sink_directory}', "
-            f"copy_behavior='{copy_behavior}', enable_staging='{enable_staging}'"
+            "LakehouseFilesSink initialized: sink_directory='%s', "
+            "copy_behavior='%s', enable_staging='%s'",
+            sink_directory,
+            copy_behavior,
+            enable_staging,
         )
 
     @property
@@ -91,7 +91,9 @@ class LakehouseTableSink(BaseSink):
         self.sink_table_action = sink_table_action
 
         logger.info(
-            f"LakehouseTableSink initialized: sink_table_name='{sink_table_name}', sink_table_action='{sink_table_action}'"
+            "LakehouseTableSink initialized: sink_table_name='%s', sink_table_action='%s'",
+            sink_table_name,
+            sink_table_action,
         )
 
     @property
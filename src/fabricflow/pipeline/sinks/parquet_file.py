@@ -86,7 +86,9 @@ class ParquetFileSink(BaseSink):
         self.sink_directory = sink_directory
 
         logger.info(
-            f"ParquetFileSink initialized: sink_file_name='{sink_file_name}', sink_directory='{sink_directory}'"
+            "ParquetFileSink initialized: sink_file_name='%s', sink_directory='%s'",
+            sink_file_name,
+            sink_directory,
         )
 
     @property
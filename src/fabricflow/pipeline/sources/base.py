@@ -37,10 +37,26 @@ Example:
 import logging
 from logging import Logger
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Sequence
 
 logger: Logger = logging.getLogger(__name__)
 
+_DIGITS: frozenset[str] = frozenset("0123456789")
+
+
+def _is_timespan(value: str) -> bool:
+    """Check that value is an 'HH:MM:SS' timespan made of three digit groups."""
+    i = value.find(":")
+    j = value.find(":", i + 1)
+    return (
+        i > 0
+        and j > i + 1
+        and j < len(value) - 1
+        and _DIGITS.issuperset(value[:i])
+        and _DIGITS.issuperset(value[i + 1 : j])
+        and _DIGITS.issuperset(value[j + 1 :])
+    )
+
 
 class BaseSource(ABC):
     """
@@ -82,6 +98,8 @@ class BaseSource(ABC):
         ```
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """
         Initialize the base source.
@@ -89,20 +107,21 @@ class BaseSource(ABC):
         This constructor should be called by all subclass constructors using super().__init__().
         It provides any common initialization logic needed by all sources.
         """
-        logger.debug(f"Initializing {self.__class__.__name__}")
+        logger.debug("Initializing %s", self.__class__.__name__)
 
     @property
     @abstractmethod
-    def required_params(self) -> list[str]:
+    def required_params(self) -> Sequence[str]:
         """
-        Abstract property that returns a list of required parameter names.
+        Abstract property that returns a sequence of required parameter names.
         
         This property must be implemented by all concrete source classes to specify
         which parameters are mandatory when using the source in pipeline activities.
         These parameters will be validated when building pipeline payloads.
+        Callers treat the result as read-only, so a shared tuple may be returned.
         
         Returns:
-            list[str]: List of required parameter names that must be provided
+            Sequence[str]: Required parameter names that must be provided
                       when using this source type.
                       
         Example:
@@ -87,8 +87,11 @@ class FileSystemSource(BaseSource):
         self.max_concurrent_connections = max_concurrent_connections
 
         logger.info(
-            f"FileSystemSource initialized: source_connection_id='{source_connection_id}', "
-            f"source_folder_pattern='{source_folder_pattern}', source_file_pattern='{source_file_pattern}'"
+            "FileSystemSource initialized: source_connection_id='%s', "
+            "source_folder_pattern='%s', source_file_pattern='%s'",
+            source_connection_id,
+            source_folder_pattern,
+            source_file_pattern,
         )
 
     @property
@@ -159,11 +159,14 @@ class GoogleBigQuerySource(BaseSource):
         self.source_query = source_query
         self.first_row_only = first_row_only
 
-        logger.info(
-            f"GoogleBigQuerySource initialized: source_connection_id='{source_connection_id}', "
-            f"source_query='{(source_query[:50] + '...') if source_query else None}', "
-            f"first_row_only={first_row_only}"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "GoogleBigQuerySource initialized: source_connection_id='%s', "
+                "source_query='%s', first_row_only=%s",
+                source_connection_id,
+                (source_query[:50] + "...") if source_query else None,
+                first_row_only,
+            )
 
     @property
     def required_params(self) -> list[str]:
@@ -15,7 +15,7 @@ Example:
     )
 """
 
-from .base import BaseSource
+from .base import BaseSource, _is_timespan
 from .types import SourceType
 from logging import Logger
 import logging
@@ -59,8 +59,7 @@ class PostgreSQLSource(BaseSource):
                 raise ValueError(
                     "query_timeout must be a timespan string in 'HH:MM:SS' format, e.g., '02:00:00'."
                 )
-            parts = query_timeout.split(":")
-            if len(parts) != 3 or not all(p.isdigit() for p in parts):
+            if not _is_timespan(query_timeout):
                 raise ValueError(
                     "query_timeout must be a timespan string in 'HH:MM:SS' format, e.g., '02:00:00'."
                 )
@@ -70,9 +69,12 @@ class PostgreSQLSource(BaseSource):
         self.first_row_only = first_row_only
         self.query_timeout = query_timeout
 
-        logger.info(
-            f"PostgreSQLSource initialized: source_connection_id='{source_connection_id}', source_query='{(source_query[:50] + '...') if source_query else None}'"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "PostgreSQLSource initialized: source_connection_id='%s', source_query='%s'",
+                source_connection_id,
+                (source_query[:50] + "...") if source_query else None,
+            )
 
     @property
     def required_params(self) -> list[str]:
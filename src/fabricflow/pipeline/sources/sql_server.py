@@ -85,7 +85,7 @@ Dependencies:
 - fabricflow.pipeline.sources.types: For SourceType and IsolationLevel enums
 """
 
-from .base import BaseSource
+from .base import BaseSource, _is_timespan
 from .types import SourceType, IsolationLevel
 from logging import Logger
 import logging
@@ -93,6 +93,8 @@ from typing import Any, Optional
 
 logger: Logger = logging.getLogger(__name__)
 
+_SOURCE_TYPE_VALUE: str = SourceType.SQL_SERVER.value
+
 
 class SQLServerSource(BaseSource):
     """
@@ -216,6 +218,17 @@ class SQLServerSource(BaseSource):
         - first_row_only should only be used with Lookup activities, not Copy activities
     """
 
+    __slots__ = (
+        "source_connection_id",
+        "source_database_name",
+        "source_query",
+        "first_row_only",
+        "isolation_level",
+        "query_timeout",
+    )
+
+    _REQUIRED_PARAMS: tuple[str, ...] = ("source_query",)
+
     def __init__(
         self,
         source_connection_id: str,
@@ -242,8 +255,7 @@ class SQLServerSource(BaseSource):
                 raise ValueError(
                     "query_timeout must be a timespan string in 'HH:MM:SS' format, e.g., '02:00:00'."
                 )
-            parts = query_timeout.split(":")
-            if len(parts) != 3 or not all(p.isdigit() for p in parts):
+            if not _is_timespan(query_timeout):
                 raise ValueError(
                     "query_timeout must be a timespan string in 'HH:MM:SS' format, e.g., '02:00:00'."
                 )
@@ -255,17 +267,21 @@ class SQLServerSource(BaseSource):
         self.isolation_level = isolation_level
         self.query_timeout = query_timeout
 
-        logger.info(
-            f"SQLServerSource initialized: source_connection_id='{source_connection_id}', source_database_name='{source_database_name}', source_query='{(source_query[:50] + '...') if source_query else None}'"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "SQLServerSource initialized: source_connection_id='%s', source_database_name='%s', source_query='%s'",
+                source_connection_id,
+                source_database_name,
+                (source_query[:50] + "...") if source_query else None,
+            )
 
     @property
-    def required_params(self) -> list[str]:
+    def required_params(self) -> tuple[str, ...]:
         """
-        Returns a list of required parameters for the SQL Server source.
+        Returns the required parameters for the SQL Server source.
         This can be overridden by subclasses to provide specific parameters.
         """
-        return ["source_query"]
+        return self._REQUIRED_PARAMS
 
     def to_dict(self) -> dict[str, str]:
         """
@@ -273,7 +289,7 @@ class SQLServerSource(BaseSource):
         Only includes 'source_query' if source_query is not empty.
         """
         result: dict[str, Any] = {
-            "source_type": SourceType.SQL_SERVER.value,
+            "source_type": _SOURCE_TYPE_VALUE,
             "source_connection_id": self.source_connection_id,
             "source_database_name": self.source_database_name,
         }
@@ -282,7 +298,7 @@ class SQLServerSource(BaseSource):
         if self.first_row_only is not None:
             result["first_row_only"] = self.first_row_only
         if self.isolation_level is not None:
-            result["isolation_level"] = self.isolation_level.value
+            result["isolation_level"] = self.isolation_level
         if self.query_timeout is not None:
             result["query_timeout"] = self.query_timeout
         return result
@@ -3,7 +3,8 @@ Type definitions for Microsoft Fabric data pipeline sources.
 
 This module defines enums and type constants used throughout the pipeline
 sources system. These types ensure consistency and provide clear interfaces
-for configuring data sources.
+for configuring data sources. Members are also strings, so they compare
+equal to and serialize as their values.
 
 Classes:
     SourceType: Enum defining supported data source types.
@@ -22,7 +23,7 @@ Example:
 from enum import Enum
 
 
-class SourceType(Enum):
+class SourceType(str, Enum):
     """
     Enumeration of supported data source types for Microsoft Fabric pipelines.
 
@@ -56,8 +57,11 @@ class SourceType(Enum):
     POSTGRESQL = "PostgreSQL"
     FILE_SERVER = "FileServer"
 
+    def __str__(self) -> str:
+        return self.value
 
-class IsolationLevel(Enum):
+
+class IsolationLevel(str, Enum):
     """
     Enumeration of SQL transaction isolation levels for database sources.
 
@@ -99,3 +103,6 @@ class IsolationLevel(Enum):
     REPEATABLE_READ = "RepeatableRead"
     SERIALIZABLE = "Serializable"
     SNAPSHOT = "Snapshot"
+
+    def __str__(self) -> str:
+        return self.value
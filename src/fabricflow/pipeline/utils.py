@@ -60,7 +60,9 @@ def create_data_pipeline(
 
     # Only pass supported parameters to create_item
     logger.info(
-        f"Creating data pipeline with template: {resolved_display_name} in workspace: {workspace}"
+        "Creating data pipeline with template: %s in workspace: %s",
+        resolved_display_name,
+        workspace,
     )
 
     # Prepare the payload for FabricCoreItemsManager
@@ -0,0 +1,87 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from fabricflow.auth.provider import (
+    TOKEN_REFRESH_MARGIN,
+    ServicePrincipalTokenProvider,
+)
+
+
+class FakeCredential:
+    """Stands in for ClientSecretCredential and counts get_token calls."""
+
+    def __init__(self, lifetime: float = 3600, delay: float = 0) -> None:
+        self.lifetime = lifetime
+        self.delay = delay
+        self.calls: list[str] = []
+        self._lock = threading.Lock()
+
+    def get_token(self, scope: str) -> SimpleNamespace:
+        with self._lock:
+            self.calls.append(scope)
+            n = len(self.calls)
+        time.sleep(self.delay)
+        return SimpleNamespace(
+            token=f"token-{n}", expires_on=int(time.time() + self.lifetime)
+        )
+
+
+@pytest.fixture
+def provider() -> ServicePrincipalTokenProvider:
+    return ServicePrincipalTokenProvider("tenant", "client", "secret")
+
+
+def test_repeated_calls_fetch_once(provider):
+    credential = FakeCredential()
+    provider._credential = credential
+
+    tokens = {provider("pbi") for _ in range(100)}
+
+    assert tokens == {"token-1"}
+    assert len(credential.calls) == 1
+
+
+def test_token_refreshed_within_margin(provider):
+    credential = FakeCredential(lifetime=TOKEN_REFRESH_MARGIN - 1)
+    provider._credential = credential
+
+    assert provider("pbi") == "token-1"
+    assert provider("pbi") == "token-2"
+    assert len(credential.calls) == 2
+
+
+def test_tokens_cached_per_audience(provider):
+    credential = FakeCredential()
+    provider._credential = credential
+
+    for _ in range(3):
+        assert provider("pbi") == "token-1"
+        assert provider("storage") == "token-2"
+
+    assert credential.calls == [
+        ServicePrincipalTokenProvider.SCOPE_MAPPING["pbi"],
+        ServicePrincipalTokenProvider.SCOPE_MAPPING["storage"],
+    ]
+
+
+def test_concurrent_first_calls_fetch_once(provider):
+    credential = FakeCredential(delay=0.1)
+    provider._credential = credential
+    barrier = threading.Barrier(10)
+    results: list[str] = []
+
+    def call() -> None:
+        barrier.wait()
+        results.append(provider("pbi"))
+
+    threads = [threading.Thread(target=call) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["token-1"] * 10
+    assert len(credential.calls) == 1
@@ -0,0 +1,82 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from requests import HTTPError
+from sempy.fabric import FabricRestClient
+
+from fabricflow.core.items import manager as manager_module
+from fabricflow.core.items.manager import FabricCoreItemsManager
+from fabricflow.core.items.types import FabricItemType
+
+
+class FakeResponse(SimpleNamespace):
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise HTTPError(f"{self.status_code} for {self.url}")
+
+    def json(self):
+        return self.body
+
+
+class FakeClient(FabricRestClient):
+    """Records requests and fails those whose URL or display name contains 'bad'."""
+
+    def __init__(self) -> None:
+        self.deleted: list[str] = []
+        self._lock = threading.Lock()
+
+    def post(self, url, json=None):
+        # Finish later items first so that ordering is not an accident of timing.
+        time.sleep(0.05 if json["displayName"].endswith("0") else 0)
+        status = 400 if "bad" in json["displayName"] else 201
+        return FakeResponse(
+            status_code=status, url=url, body={"displayName": json["displayName"]}
+        )
+
+    def delete(self, url):
+        with self._lock:
+            self.deleted.append(url.rsplit("/", 1)[-1])
+        status = 404 if "bad" in url else 200
+        return FakeResponse(status_code=status, url=url, body=None)
+
+
+@pytest.fixture
+def client() -> FakeClient:
+    return FakeClient()
+
+
+@pytest.fixture
+def manager(client, monkeypatch) -> FabricCoreItemsManager:
+    monkeypatch.setattr(manager_module, "get_workspace_id", lambda workspace: "ws-id")
+    return FabricCoreItemsManager(client, "ws")
+
+
+def test_bulk_create_items_preserves_order(manager):
+    names = [f"item-{i}" for i in range(10)]
+
+    created = manager.bulk_create_items(
+        [{"display_name": n, "item_type": FabricItemType.LAKEHOUSE} for n in names]
+    )
+
+    assert [item["displayName"] for item in created] == names
+
+
+def test_bulk_create_items_raises_http_error(manager):
+    with pytest.raises(HTTPError):
+        manager.bulk_create_items(
+            [
+                {"display_name": "good", "item_type": FabricItemType.LAKEHOUSE},
+                {"display_name": "bad", "item_type": FabricItemType.LAKEHOUSE},
+            ]
+        )
+
+
+def test_bulk_delete_items_raises_first_error_and_deletes_the_rest(manager, client):
+    item_ids = ["a", "bad-1", "b", "bad-2", "c"]
+
+    with pytest.raises(HTTPError, match="bad-1"):
+        manager.bulk_delete_items(item_ids, max_workers=2)
+
+    assert sorted(client.deleted) == sorted(item_ids)
@@ -0,0 +1,124 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from fabricflow.core.items import utils
+from fabricflow.core.items.types import FabricItemType
+
+THREADS = 8
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    utils.clear_item_id_cache()
+    yield
+    utils.clear_item_id_cache()
+
+
+@pytest.fixture(autouse=True)
+def current_workspace(monkeypatch) -> dict:
+    """The workspace reported by get_workspace_id(); tests may switch it."""
+    context = {"id": "ws-1"}
+    monkeypatch.setattr(utils, "get_workspace_id", lambda: context["id"])
+    return context
+
+
+class BlockingResolver:
+    """Stands in for sempy's resolve_item_id, holding every call until released."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self.error = error
+        self.calls = 0
+        self.release = threading.Event()
+
+    def __call__(self, item, item_type, workspace):
+        self.calls += 1
+        self.release.wait(timeout=5)
+        if self.error is not None:
+            raise self.error
+        return f"id-of-{item}"
+
+
+def _resolve_concurrently(resolver: BlockingResolver) -> list:
+    """Resolve the same item from several threads and collect results or errors."""
+
+    def resolve():
+        try:
+            return utils.resolve_item("MyLakehouse", FabricItemType.LAKEHOUSE, "ws")
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        futures = [executor.submit(resolve) for _ in range(THREADS)]
+        # Give every thread time to reach the in-flight lookup before releasing it.
+        time.sleep(0.2)
+        resolver.release.set()
+        return [f.result() for f in futures]
+
+
+def test_concurrent_misses_make_one_call(monkeypatch):
+    resolver = BlockingResolver()
+    monkeypatch.setattr(utils, "resolve_item_id", resolver)
+
+    results = _resolve_concurrently(resolver)
+
+    assert results == ["id-of-MyLakehouse"] * THREADS
+    assert resolver.calls == 1
+    assert utils._in_flight == {}
+
+
+def test_exception_reaches_every_waiter(monkeypatch):
+    resolver = BlockingResolver(error=ValueError("not found"))
+    monkeypatch.setattr(utils, "resolve_item_id", resolver)
+
+    results = _resolve_concurrently(resolver)
+
+    assert all(isinstance(r, ValueError) for r in results)
+    assert resolver.calls == 1
+    assert utils._in_flight == {}
+
+
+def test_failures_are_not_cached(monkeypatch):
+    resolver = BlockingResolver(error=ValueError("not found"))
+    resolver.release.set()
+    monkeypatch.setattr(utils, "resolve_item_id", resolver)
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            utils.resolve_item("MyLakehouse")
+
+    assert resolver.calls == 2
+
+
+def test_clear_item_id_cache_forces_new_lookup(monkeypatch):
+    resolver = BlockingResolver()
+    resolver.release.set()
+    monkeypatch.setattr(utils, "resolve_item_id", resolver)
+
+    utils.resolve_item("MyLakehouse")
+    utils.resolve_item("MyLakehouse")
+    assert resolver.calls == 1
+
+    utils.clear_item_id_cache()
+    utils.resolve_item("MyLakehouse")
+    assert resolver.calls == 2
+
+
+def test_current_workspace_is_not_pinned_by_the_cache(monkeypatch, current_workspace):
+    workspaces: list[str] = []
+    monkeypatch.setattr(
+        utils, "resolve_item_id", lambda item, t, ws: workspaces.append(ws) or ws
+    )
+    monkeypatch.setattr(
+        utils, "resolve_item_name", lambda item, t, ws: workspaces.append(ws) or ws
+    )
+
+    assert utils.resolve_item("MyLakehouse") == "ws-1"
+    assert utils.is_valid_item_id("MyLakehouse")
+    current_workspace["id"] = "ws-2"
+    assert utils.resolve_item("MyLakehouse") == "ws-2"
+    assert utils.is_valid_item_id("MyLakehouse")
+
+    assert workspaces == ["ws-1", "ws-1", "ws-2", "ws-2"]
@@ -0,0 +1,16 @@
+from fabricflow.pipeline.activities.lookup.executor import LookupActivityExecutor
+
+
+def _executor() -> LookupActivityExecutor:
+    # Skip __init__, which resolves the workspace and pipeline through Sempy.
+    return LookupActivityExecutor.__new__(LookupActivityExecutor)
+
+
+def test_activity_filter_is_not_shared_between_calls():
+    first = _executor().get_activity_filter()
+    first.append({"operand": "Status", "operator": "Equals", "values": ["Failed"]})
+    first[0]["values"].append("Copy")
+
+    assert _executor().get_activity_filter() == [
+        {"operand": "ActivityType", "operator": "Equals", "values": ["Lookup"]}
+    ]
@@ -0,0 +1,91 @@
+import time
+
+import pytest
+
+from fabricflow.pipeline.activities.lookup import lookup as lookup_module
+from fabricflow.pipeline.activities.lookup.lookup import Lookup
+from fabricflow.pipeline.executor import DataPipelineError
+from fabricflow.pipeline.sources import SQLServerSource
+
+
+class FakeExecutor:
+    """Stands in for LookupActivityExecutor and records every run."""
+
+    runs: list[str] = []
+
+    def __init__(self, client, workspace, pipeline, payload, **kwargs) -> None:
+        self.pipeline = pipeline
+        self.payload = payload
+
+    def run(self) -> dict:
+        FakeExecutor.runs.append(self.pipeline)
+        # Finish later lookups first so that ordering is not an accident of timing.
+        time.sleep(0.05 if self.pipeline.endswith("0") else 0)
+        if self.pipeline.startswith("bad"):
+            raise DataPipelineError(f"{self.pipeline} failed")
+        return {
+            "pipeline_id": self.pipeline,
+            "parameters": dict(self.payload["executionData"]["parameters"]),
+        }
+
+
+@pytest.fixture(autouse=True)
+def fake_executor(monkeypatch):
+    FakeExecutor.runs = []
+    monkeypatch.setattr(lookup_module, "LookupActivityExecutor", FakeExecutor)
+
+
+def _lookup(pipeline: str) -> Lookup:
+    source = SQLServerSource(
+        source_connection_id="conn",
+        source_database_name="db",
+        source_query="SELECT 1",
+    )
+    return Lookup(client=None, workspace="ws", pipeline=pipeline).source(source)
+
+
+def test_execute_many_preserves_order():
+    pipelines = [f"pipeline-{i}" for i in range(10)]
+
+    results = Lookup.execute_many([_lookup(p) for p in pipelines], max_workers=4)
+
+    assert [r["pipeline_id"] for r in results] == pipelines
+
+
+def test_execute_many_raises_first_error_and_runs_the_rest():
+    pipelines = ["a", "bad-1", "b", "bad-2", "c"]
+
+    with pytest.raises(DataPipelineError, match="bad-1"):
+        Lookup.execute_many([_lookup(p) for p in pipelines], max_workers=2)
+
+    assert sorted(FakeExecutor.runs) == sorted(pipelines)
+
+
+def test_execute_many_with_no_lookups():
+    assert Lookup.execute_many([]) == []
+    assert FakeExecutor.runs == []
+
+
+def test_execute_picks_up_params_set_after_build():
+    lookup = _lookup("pipeline").build()
+
+    result = lookup.params(x=1).execute()
+
+    assert result["parameters"]["x"] == 1
+
+
+def test_execute_picks_up_items_set_after_build():
+    lookup = _lookup("pipeline").build()
+
+    result = lookup.items([{"source_query": "SELECT 2"}]).execute()
+
+    assert result["parameters"]["items"][0]["source_query"] == "SELECT 2"
+
+
+def test_build_is_a_no_op_once_built():
+    lookup = _lookup("pipeline").build()
+    parameters = lookup._payload["executionData"]["parameters"]
+
+    lookup.build()
+
+    assert lookup._payload["executionData"]["parameters"] is parameters
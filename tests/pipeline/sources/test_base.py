@@ -0,0 +1,33 @@
+import pytest
+
+from fabricflow.pipeline.sources.base import _is_timespan
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["02:00:00", "1:2:3", "00:00:00", "123:45:67"],
+)
+def test_valid_timespans(value):
+    assert _is_timespan(value)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "",
+        "::",
+        "01:02",
+        "01:02:03:04",
+        ":01:02",
+        "01::02",
+        "01:02:",
+        "01:02:0a",
+        " 01:02:03",
+        "01:02:03 ",
+        "-1:02:03",
+        "١٢:00:00",  # Arabic-Indic digits, accepted by str.isdigit()
+        "01:²:00",  # superscript two, accepted by str.isdigit()
+    ],
+)
+def test_invalid_timespans(value):
+    assert not _is_timespan(value)
@@ -0,0 +1,39 @@
+from fabricflow.pipeline.sources import IsolationLevel, SQLServerSource
+
+
+def _source() -> SQLServerSource:
+    return SQLServerSource(
+        source_connection_id="conn",
+        source_database_name="db",
+        source_query="select 1",
+    )
+
+
+def test_to_dict():
+    source = _source()
+    source.isolation_level = IsolationLevel.SNAPSHOT
+
+    assert source.to_dict() == {
+        "source_type": "SQLServer",
+        "source_connection_id": "conn",
+        "source_database_name": "db",
+        "source_query": "select 1",
+        "isolation_level": "Snapshot",
+        "query_timeout": "02:00:00",
+    }
+
+
+def test_to_dict_reflects_reassigned_attributes():
+    source = _source()
+    source.to_dict()
+
+    source.source_query = "select 2"
+
+    assert source.to_dict()["source_query"] == "select 2"
+
+
+def test_to_dict_returns_a_new_dict():
+    source = _source()
+    source.to_dict()["source_query"] = "changed"
+
+    assert source.to_dict()["source_query"] == "select 1"
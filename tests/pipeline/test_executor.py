@@ -0,0 +1,47 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from fabricflow.pipeline.executor import DataPipelineExecutor
+
+
+def _executor(poll_interval: int = 15) -> DataPipelineExecutor:
+    # Skip __init__, which resolves the workspace and pipeline through Sempy.
+    executor = DataPipelineExecutor.__new__(DataPipelineExecutor)
+    executor.default_poll_interval = poll_interval
+    return executor
+
+
+def _throttled(retry_after: str) -> SimpleNamespace:
+    return SimpleNamespace(status_code=429, headers={"Retry-After": retry_after})
+
+
+def test_poll_delay_never_exceeds_poll_interval():
+    executor = _executor(poll_interval=15)
+    for attempt in range(10):
+        for _ in range(50):
+            assert 0 < executor._poll_delay(attempt) <= 15
+
+
+def test_poll_delay_handles_long_running_loops():
+    executor = _executor(poll_interval=15)
+    for attempt in (1023, 5000):
+        assert 7.5 <= executor._poll_delay(attempt) <= 15
+
+
+def test_poll_delay_keeps_jitter_once_capped():
+    executor = _executor(poll_interval=15)
+    delays = {executor._poll_delay(10) for _ in range(50)}
+    assert len(delays) > 1
+
+
+def test_poll_delay_honours_retry_after():
+    assert _executor()._poll_delay(0, _throttled("42")) == 42
+
+
+def test_poll_delay_stops_at_end_time():
+    executor = _executor()
+    end_time = datetime.now() + timedelta(seconds=5)
+
+    assert executor._poll_delay(0, _throttled("3600"), end_time) <= 5
+    assert executor._poll_delay(9, None, end_time) <= 5
+    assert executor._poll_delay(0, None, datetime.now() - timedelta(seconds=1)) == 0
@@ -0,0 +1,41 @@
+import ast
+from pathlib import Path
+
+import fabricflow
+
+STUB_PATH = Path(fabricflow.__file__).with_name("__init__.pyi")
+
+
+def _stub_exports() -> set[str]:
+    """Names re-exported by the stub: ``import X as X`` aliases and assignments."""
+    names: set[str] = set()
+    for node in ast.parse(STUB_PATH.read_text()).body:
+        if isinstance(node, ast.ImportFrom):
+            names.update(a.asname for a in node.names if a.asname == a.name)
+        elif isinstance(node, ast.Assign):
+            names.update(t.id for t in node.targets if isinstance(t, ast.Name))
+    return names
+
+
+def test_lazy_exports_match_all():
+    assert set(fabricflow._LAZY_EXPORTS) == set(fabricflow.__all__) - {"setup_logging"}
+
+
+def test_stub_exports_match_all():
+    assert _stub_exports() == set(fabricflow.__all__)
+
+
+def test_lazy_exports_resolve():
+    for name in fabricflow._LAZY_EXPORTS:
+        getattr(fabricflow, name)
+
+
+def test_package_is_typed():
+    assert STUB_PATH.with_name("py.typed").is_file()
+
+
+def test_dir_lists_public_names_only():
+    import fabricflow.auth
+
+    assert dir(fabricflow) == sorted(fabricflow.__all__)
+    assert dir(fabricflow.auth) == sorted(fabricflow.auth.__all__)
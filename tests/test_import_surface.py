@@ -0,0 +1,48 @@
+import importlib
+import logging
+import os
+import subprocess
+import sys
+
+import fabricflow
+
+FRESH_IMPORT = """
+import sys
+import fabricflow
+loaded = sorted(
+    name
+    for name in sys.modules
+    if name.startswith(("fabricflow.pipeline", "fabricflow.core", "fabricflow.auth"))
+    or name.split(".")[0] in ("sempy", "azure")
+)
+print(",".join(loaded))
+"""
+
+
+def _null_handlers() -> list[logging.Handler]:
+    return [
+        h
+        for h in logging.getLogger("fabricflow").handlers
+        if isinstance(h, logging.NullHandler)
+    ]
+
+
+def test_single_null_handler():
+    assert len(_null_handlers()) == 1
+
+
+def test_reload_does_not_add_null_handler():
+    importlib.reload(fabricflow)
+    assert len(_null_handlers()) == 1
+
+
+def test_import_does_not_load_submodules():
+    result = subprocess.run(
+        [sys.executable, "-c", FRESH_IMPORT],
+        capture_output=True,
+        text=True,
+        check=True,
+        # The eager import mode used in CI would defeat the point of this check.
+        env={k: v for k, v in os.environ.items() if k != "FABRICFLOW_EAGER_IMPORT"},
+    )
+    assert result.stdout.strip() == ""